@@ -4,13 +4,14 @@ Core module for multi-function Slack bot.
 Contains shared infrastructure for routing, storage, and function management.
 """
 
-from .models import BotFunction, FunctionInfo, FunctionResponse, MessageResult
+from .models import BotFunction, DMEvent, FunctionInfo, FunctionResponse, MessageResult
 from .storage import StateStorage, PermissionsStorage, UsageLogger, configure_storage
 from .dispatcher import Dispatcher
 from .plugin_loader import PluginLoader
 
 __all__ = [
     'BotFunction',
+    'DMEvent',
     'FunctionInfo',
     'FunctionResponse',
     'MessageResult',
@@ -12,7 +12,7 @@ from typing import Optional, Callable
 
 from pathlib import Path
 
-from .models import BotFunction, FunctionResponse, MessageResult
+from .models import BotFunction, FunctionInfo, FunctionResponse, MessageResult
 from .storage import StateStorage, PermissionsStorage, UsageLogger, configure_storage
 from .plugin_loader import PluginLoader
 
@@ -30,12 +30,48 @@ class Dispatcher:
         self.usage_logger = UsageLogger()
         self.plugin_loader = PluginLoader(allowed_functions=allowed_functions)
         self.functions: dict[str, BotFunction] = {}
+        self._info_cache: dict[str, FunctionInfo] = {}
+        self._help_lines: dict[str, str] = {}
+        self._help_entries: dict[str, str] = {}
+        self._home_blocks: dict[str, dict] = {}
 
         self._load_functions()
 
     def _load_functions(self) -> None:
         """Discover and load all function modules."""
         self.functions = self.plugin_loader.load_all_functions()
+
+        # FunctionInfo is static, so fetch it once per load instead of per DM
+        self._info_cache = {
+            name: func.get_info() for name, func in self.functions.items()
+        }
+        self._help_lines = {
+            name: f"- `{info.slash_command}` - {info.description}"
+            for name, info in self._info_cache.items()
+        }
+        # /bot-help entries and App Home blocks, rebuilt with the functions
+        self._help_entries = {
+            name: (
+                f"*{info.display_name}*\n"
+                f"  Command: `{info.slash_command}`\n"
+                f"  {info.description}\n"
+            )
+            for name, info in self._info_cache.items()
+        }
+        self._home_blocks = {
+            name: {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": (
+                        f"*{info.display_name}*\n"
+                        f"{info.description}\n"
+                        f"Command: `{info.slash_command}`"
+                    )
+                }
+            }
+            for name, info in self._info_cache.items()
+        }
         logger.info(
             f"Loaded {len(self.functions)} functions: {list(self.functions.keys())}"
         )
@@ -44,10 +80,28 @@ class Dispatcher:
         """Get a function by name."""
         return self.functions.get(name)
 
+    def get_function_info(self, name: str) -> Optional[FunctionInfo]:
+        """Get cached metadata for a function by name."""
+        return self._info_cache.get(name)
+
+    def get_help_entry(self, name: str) -> str:
+        """Get the cached /bot-help entry for a loaded function."""
+        return self._help_entries[name]
+
+    def get_home_block(self, name: str) -> dict:
+        """Get the cached App Home section block for a loaded function."""
+        return self._home_blocks[name]
+
     def get_all_function_names(self) -> list[str]:
         """Get list of all loaded function names."""
         return list(self.functions.keys())
 
+    def get_allowed_function_names(self, user_id: str) -> list[str]:
+        """Get names of functions the user can access."""
+        return self.permissions.get_allowed_functions(
+            user_id, self.get_all_function_names()
+        )
+
     def handle_dm(
         self,
         user_id: str,
@@ -164,8 +218,7 @@ class Dispatcher:
 
     def get_available_functions_for_user(self, user_id: str) -> list[BotFunction]:
         """Get list of functions available to a user."""
-        all_names = self.get_all_function_names()
-        allowed_names = self.permissions.get_allowed_functions(user_id, all_names)
+        allowed_names = self.get_allowed_function_names(user_id)
         return [
             self.functions[name]
             for name in allowed_names
@@ -178,8 +231,7 @@ class Dispatcher:
         say: Callable[[str], None]
     ) -> None:
         """Handle case where user hasn't selected a function."""
-        all_names = self.get_all_function_names()
-        allowed = self.permissions.get_allowed_functions(user_id, all_names)
+        allowed = self.get_allowed_function_names(user_id)
 
         if not allowed:
             say(
@@ -189,12 +241,11 @@ class Dispatcher:
             return
 
         # Build function list with commands
-        func_list = []
-        for func_name in allowed:
-            func = self.get_function(func_name)
-            if func:
-                info = func.get_info()
-                func_list.append(f"- `{info.slash_command}` - {info.description}")
+        func_list = [
+            self._help_lines[func_name]
+            for func_name in allowed
+            if func_name in self._help_lines
+        ]
 
         say(
             "Welcome! You haven't selected a function yet.\n\n"
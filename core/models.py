@@ -15,7 +15,7 @@ class MessageResult(Enum):
     NO_ACTION = "no_action"
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionResponse:
     """Response from a function's message handler."""
     result: MessageResult
@@ -24,9 +24,9 @@ class FunctionResponse:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FunctionInfo:
-    """Metadata about a function."""
+    """Metadata about a function. Immutable, so it can be cached and hashed."""
     name: str
     display_name: str
     slash_command: str
@@ -35,6 +35,36 @@ class FunctionInfo:
     version: str = "1.0.0"
 
 
+@dataclass(slots=True, frozen=True)
+class DMEvent:
+    """
+    The fields of a Slack DM event that the bot itself routes on.
+
+    Parsed once in main.py's message handler. Functions still receive the
+    raw Slack event dict in handle_message.
+    """
+    user: str
+    text: str
+    channel: str
+    ts: str
+    thread_ts: Optional[str] = None
+
+    @classmethod
+    def from_slack(cls, event: dict) -> Optional["DMEvent"]:
+        """Build from a raw Slack event, or None if it has no user or text."""
+        user = event.get("user")
+        text = event.get("text")
+        if not user or not text:
+            return None
+        return cls(
+            user=user,
+            text=text,
+            channel=event.get("channel", ""),
+            ts=event.get("ts", ""),
+            thread_ts=event.get("thread_ts"),
+        )
+
+
 class BotFunction(ABC):
     """
     Abstract base class that all function modules must implement.
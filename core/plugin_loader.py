@@ -4,6 +4,8 @@ Plugin loader for dynamically loading function modules.
 
 import importlib.util
 import logging
+import os
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -37,18 +39,21 @@ class PluginLoader:
         """
         functions = []
 
-        for item in self.root_dir.iterdir():
-            if not item.is_dir():
-                continue
-            if item.name in self.excluded_dirs or item.name.startswith('.'):
-                continue
-            if self.allowed_functions is not None and item.name not in self.allowed_functions:
-                continue
-
-            function_file = item / "function.py"
-            if function_file.exists():
-                functions.append(item.name)
-                logger.debug(f"Discovered function: {item.name}")
+        # scandir reports entry types from the directory read itself, so only
+        # directories that pass the name filters cost a stat() for function.py
+        with os.scandir(self.root_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name in self.excluded_dirs or name.startswith('.'):
+                    continue
+                if self.allowed_functions is not None and name not in self.allowed_functions:
+                    continue
+                if not entry.is_dir():
+                    continue
+
+                if os.path.exists(os.path.join(entry.path, "function.py")):
+                    functions.append(name)
+                    logger.debug(f"Discovered function: {name}")
 
         return functions
 
@@ -68,13 +73,25 @@ class PluginLoader:
             logger.error(f"Function file not found: {function_path}")
             return None
 
+        module_name = f"functions.{name}"
+
         try:
-            spec = importlib.util.spec_from_file_location(
-                f"functions.{name}",
-                function_path
-            )
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            # Reuse the already-executed module unless function.py changed
+            mtime = function_path.stat().st_mtime
+            module = sys.modules.get(module_name)
+            if module is None or getattr(module, "__mtime__", None) != mtime:
+                spec = importlib.util.spec_from_file_location(
+                    module_name,
+                    function_path
+                )
+                module = importlib.util.module_from_spec(spec)
+                module.__mtime__ = mtime
+                sys.modules[module_name] = module
+                try:
+                    spec.loader.exec_module(module)
+                except BaseException:
+                    sys.modules.pop(module_name, None)
+                    raise
 
             if hasattr(module, 'get_function'):
                 func = module.get_function()
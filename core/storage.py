@@ -7,9 +7,12 @@ Uses SQLite for persistence.
 import sqlite3
 import json
 import logging
+import queue
+import threading
+import time
+import atexit
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
+from typing import Any, Callable, Optional
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
@@ -17,30 +20,121 @@ logger = logging.getLogger(__name__)
 # Default database location (can be overridden via configure_storage)
 _data_dir: Optional[Path] = None
 _db_path: Optional[Path] = None
+_dir_ready = False
+
+
+# Idle connections kept open for reuse, tagged with the database they belong to
+POOL_SIZE = 8
+_pool: "queue.Queue[tuple[Path, sqlite3.Connection]]" = queue.Queue(maxsize=POOL_SIZE)
 
 
 def configure_storage(data_dir: Path) -> None:
     """Configure the storage directory. Must be called before any storage use."""
-    global _data_dir, _db_path
+    global _data_dir, _db_path, _dir_ready
     _data_dir = data_dir
     _db_path = data_dir / "bot.db"
+    _dir_ready = False
+    close_pool()
+
+
+def close_pool() -> None:
+    """Close all idle pooled connections."""
+    while True:
+        try:
+            _, conn = _pool.get_nowait()
+        except queue.Empty:
+            return
+        conn.close()
 
 
 def get_db_path() -> Path:
-    """Get the database path, creating directory if needed."""
-    global _data_dir, _db_path
+    """Get the database path, creating directory on first use."""
+    global _data_dir, _db_path, _dir_ready
+    if _dir_ready:
+        return _db_path
     if _db_path is None:
         _data_dir = Path(__file__).parent.parent / "data"
         _db_path = _data_dir / "bot.db"
     _data_dir.mkdir(parents=True, exist_ok=True)
+    _dir_ready = True
     return _db_path
 
 
+# Per-connection settings: WAL needs only NORMAL sync to stay durable across
+# app crashes, and busy_timeout covers writes from concurrent Slack threads
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=134217728",
+    "PRAGMA cache_size=-16000",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA journal_size_limit=67108864",
+)
+
+# Size of each connection's prepared-statement cache (sqlite3 default is 128)
+_CACHED_STATEMENTS = 256
+
+# Hot-path statements, shared module constants so every call hands sqlite3's
+# per-connection statement cache the same string
+_SQL_GET_FUNCTION = "SELECT current_function FROM user_state WHERE user_id = ?"
+_SQL_SET_FUNCTION = """
+    INSERT INTO user_state (user_id, current_function, last_active)
+    VALUES (?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(user_id) DO UPDATE SET
+        current_function = excluded.current_function,
+        last_active = excluded.last_active
+"""
+_SQL_TOUCH_USER = "UPDATE user_state SET last_active = CURRENT_TIMESTAMP WHERE user_id = ?"
+_SQL_HAS_PERMISSION = """
+    SELECT 1 FROM function_permissions
+    WHERE function_name = ? AND user_id = ?
+"""
+_SQL_INSERT_LOG = """
+    INSERT INTO usage_logs
+    (user_id, function_name, action, message_preview, metadata)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+
+def _open_connection(db_path: Path) -> sqlite3.Connection:
+    """Open and configure a new database connection."""
+    # Pooled connections move between threads, but only one uses each at a time
+    conn = sqlite3.connect(
+        db_path, check_same_thread=False, cached_statements=_CACHED_STATEMENTS
+    )
+    conn.row_factory = sqlite3.Row
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _checkout_connection(db_path: Path) -> sqlite3.Connection:
+    """Take an idle connection for db_path from the pool, or open a new one."""
+    while True:
+        try:
+            path, conn = _pool.get_nowait()
+        except queue.Empty:
+            return _open_connection(db_path)
+        if path == db_path:
+            return conn
+        conn.close()
+
+
+def _release_connection(db_path: Path, conn: sqlite3.Connection) -> None:
+    """Return a connection to the pool, closing it if the pool is full."""
+    if conn.in_transaction:
+        conn.rollback()
+    try:
+        _pool.put_nowait((db_path, conn))
+    except queue.Full:
+        conn.close()
+
+
 @contextmanager
 def get_connection():
-    """Context manager for database connections."""
-    conn = sqlite3.connect(get_db_path())
-    conn.row_factory = sqlite3.Row
+    """Context manager for pooled database connections."""
+    db_path = get_db_path()
+    conn = _checkout_connection(db_path)
     try:
         yield conn
         conn.commit()
@@ -48,14 +142,34 @@ def get_connection():
         conn.rollback()
         raise
     finally:
-        conn.close()
+        _release_connection(db_path, conn)
+
+
+_initialized_path: Optional[Path] = None
+_init_lock = threading.Lock()
 
 
 def init_database():
-    """Initialize database with required tables."""
+    """Initialize database with required tables. Runs once per database path."""
+    global _initialized_path
+    with _init_lock:
+        db_path = get_db_path()
+        if _initialized_path == db_path:
+            return
+        _create_schema()
+        _initialized_path = db_path
+
+    logger.info(f"Database initialized at {db_path}")
+
+
+def _create_schema() -> None:
+    """Create tables and indexes if they don't exist."""
     with get_connection() as conn:
         cursor = conn.cursor()
 
+        # WAL lets readers proceed during writes; the mode persists in the file
+        cursor.execute("PRAGMA journal_mode=WAL")
+
         # User state table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS user_state (
@@ -65,27 +179,30 @@ def init_database():
             )
         """)
 
+        # Permission tables are tiny and only ever read by primary key, so
+        # they are stored WITHOUT ROWID: rows live in the key's own B-tree
+
         # Function permissions table
-        cursor.execute("""
+        _create_without_rowid_table(cursor, "function_permissions", """
             CREATE TABLE IF NOT EXISTS function_permissions (
                 function_name TEXT,
                 user_id TEXT,
                 PRIMARY KEY (function_name, user_id)
-            )
+            ) WITHOUT ROWID
         """)
 
         # Open functions table
-        cursor.execute("""
+        _create_without_rowid_table(cursor, "open_functions", """
             CREATE TABLE IF NOT EXISTS open_functions (
                 function_name TEXT PRIMARY KEY
-            )
+            ) WITHOUT ROWID
         """)
 
         # Admins table
-        cursor.execute("""
+        _create_without_rowid_table(cursor, "admins", """
             CREATE TABLE IF NOT EXISTS admins (
                 user_id TEXT PRIMARY KEY
-            )
+            ) WITHOUT ROWID
         """)
 
         # Usage logs table
@@ -101,21 +218,188 @@ def init_database():
             )
         """)
 
-        # Create indexes for usage_logs
+        # Create indexes for usage_logs. The composite indexes match the
+        # (user_id | function_name, action) filters in the stats queries and
+        # cover them; their leading columns replace the old single-column ones.
+        cursor.execute("""
+            SELECT 1 FROM sqlite_master
+            WHERE type = 'index' AND name = 'idx_usage_logs_user_action'
+        """)
+        indexes_exist = cursor.fetchone() is not None
+
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_usage_logs_user
-            ON usage_logs(user_id)
+            CREATE INDEX IF NOT EXISTS idx_usage_logs_user_action
+            ON usage_logs(user_id, action, function_name)
         """)
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_usage_logs_function
-            ON usage_logs(function_name)
+            CREATE INDEX IF NOT EXISTS idx_usage_logs_function_action
+            ON usage_logs(function_name, action, user_id)
         """)
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_usage_logs_timestamp
             ON usage_logs(timestamp)
         """)
+        cursor.execute("DROP INDEX IF EXISTS idx_usage_logs_user")
+        cursor.execute("DROP INDEX IF EXISTS idx_usage_logs_function")
+
+        # Give the planner statistics for the new indexes once, then keep
+        # them fresh cheaply
+        if not indexes_exist:
+            cursor.execute("ANALYZE")
+        cursor.execute("PRAGMA optimize")
+
+
+def _create_without_rowid_table(cursor: sqlite3.Cursor, table: str, create_sql: str) -> None:
+    """Create a WITHOUT ROWID table, migrating an older rowid table in place."""
+    cursor.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (table,)
+    )
+    row = cursor.fetchone()
+    if row is None:
+        cursor.execute(create_sql)
+        return
+    if "WITHOUT ROWID" in row["sql"].upper():
+        return
+
+    logger.info(f"Migrating table '{table}' to WITHOUT ROWID")
+    cursor.execute("BEGIN IMMEDIATE")
+    cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+    cursor.execute(create_sql)
+    cursor.execute(f"INSERT OR IGNORE INTO {table} SELECT * FROM {table}_old")
+    cursor.execute(f"DROP TABLE {table}_old")
+    cursor.connection.commit()
+
+
+# Usage log rows are queued and written in batches by one background thread
+LOG_BATCH_SIZE = 500
+LOG_FLUSH_INTERVAL = 0.1
+
+# Longest a flush waits for the writer to reach its marker
+LOG_FLUSH_TIMEOUT = 5.0
+
+# Longer bound for the exit flush, which may drain a backlog but must not
+# hang shutdown if the writer is stuck (e.g. on a locked database)
+LOG_SHUTDOWN_FLUSH_TIMEOUT = 30.0
+
+# The writer thread also checkpoints the WAL and refreshes planner stats
+MAINTENANCE_INTERVAL = 15 * 60
+
+# Holds log rows, plus threading.Event markers queued by flush_usage_logs()
+_log_queue: "queue.Queue[tuple | threading.Event]" = queue.Queue()
+_log_writer: Optional[threading.Thread] = None
+_log_writer_lock = threading.Lock()
+
+
+def _ensure_log_writer() -> None:
+    """Start the usage log writer thread if it isn't running yet."""
+    global _log_writer
+    if _log_writer is not None:
+        return
+    with _log_writer_lock:
+        if _log_writer is None:
+            _log_writer = threading.Thread(
+                target=_log_writer_loop, name="usage-log-writer", daemon=True
+            )
+            _log_writer.start()
+            atexit.register(flush_usage_logs, LOG_SHUTDOWN_FLUSH_TIMEOUT)
+
+
+def _log_writer_loop() -> None:
+    """Drain the log queue, writing up to LOG_BATCH_SIZE rows per transaction."""
+    next_maintenance = time.monotonic() + MAINTENANCE_INTERVAL
+    while True:
+        try:
+            first = _log_queue.get(
+                timeout=max(0.0, next_maintenance - time.monotonic())
+            )
+        except queue.Empty:
+            _run_maintenance()
+            next_maintenance = time.monotonic() + MAINTENANCE_INTERVAL
+            continue
+
+        # Batch rows until the batch is full, the window closes, or a flush
+        # marker arrives; the marker is set once the rows before it are written
+        rows = []
+        marker = None
+        item = first
+        deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+        while True:
+            if isinstance(item, threading.Event):
+                marker = item
+                break
+            rows.append(item)
+            remaining = deadline - time.monotonic()
+            if len(rows) >= LOG_BATCH_SIZE or remaining <= 0:
+                break
+            try:
+                item = _log_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+
+        if rows:
+            try:
+                _write_log_rows(rows)
+            except Exception:
+                logger.exception(f"Failed to write {len(rows)} usage log rows")
+        if marker is not None:
+            marker.set()
+
+        if time.monotonic() >= next_maintenance:
+            _run_maintenance()
+            next_maintenance = time.monotonic() + MAINTENANCE_INTERVAL
+
+
+def _run_maintenance() -> None:
+    """Truncate the WAL file and let SQLite refresh its query planner stats."""
+    try:
+        with get_connection() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.execute("PRAGMA optimize")
+    except Exception:
+        logger.exception("SQLite maintenance failed")
+
+
+def _serialize_metadata(function_name: str, action: str, metadata: Optional[dict]) -> Optional[str]:
+    """Serialize one row's metadata, or None if it is empty or can't be serialized."""
+    if not metadata:
+        return None
+    try:
+        return json.dumps(metadata)
+    except Exception:
+        # Only this row loses its metadata; the rest of the batch is unaffected
+        logger.warning(
+            f"Dropping unserializable usage log metadata for {function_name}/{action}",
+            exc_info=True
+        )
+        return None
+
+
+def _write_log_rows(rows: list[tuple]) -> None:
+    """Insert a batch of usage log rows in a single transaction."""
+    # Metadata arrives as a dict and is serialized here, off the event thread
+    rows = [
+        (user_id, function_name, action, preview,
+         _serialize_metadata(function_name, action, metadata))
+        for user_id, function_name, action, preview, metadata in rows
+    ]
+    with get_connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(_SQL_INSERT_LOG, rows)
 
-    logger.info(f"Database initialized at {get_db_path()}")
+
+def flush_usage_logs(timeout: float = LOG_FLUSH_TIMEOUT) -> bool:
+    """
+    Wait until rows queued before this call have been written.
+
+    Only waits for its own marker, so steady logging from other threads
+    can't stall it. Returns False if the timeout expired first.
+    """
+    if _log_writer is None:
+        return True
+    marker = threading.Event()
+    _log_queue.put(marker)
+    return marker.wait(timeout)
 
 
 class StateStorage:
@@ -128,10 +412,7 @@ class StateStorage:
         """Get the current function name for a user, or None."""
         with get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                "SELECT current_function FROM user_state WHERE user_id = ?",
-                (user_id,)
-            )
+            cursor.execute(_SQL_GET_FUNCTION, (user_id,))
             row = cursor.fetchone()
             return row["current_function"] if row else None
 
@@ -139,13 +420,7 @@ class StateStorage:
         """Set the current function for a user."""
         with get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO user_state (user_id, current_function, last_active)
-                VALUES (?, ?, ?)
-                ON CONFLICT(user_id) DO UPDATE SET
-                    current_function = excluded.current_function,
-                    last_active = excluded.last_active
-            """, (user_id, function_name, datetime.utcnow().isoformat()))
+            cursor.execute(_SQL_SET_FUNCTION, (user_id, function_name))
 
     def clear_user_function(self, user_id: str) -> None:
         """Clear the user's current function."""
@@ -155,9 +430,46 @@ class StateStorage:
         """Update the user's last active timestamp."""
         with get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                UPDATE user_state SET last_active = ? WHERE user_id = ?
-            """, (datetime.utcnow().isoformat(), user_id))
+            cursor.execute(_SQL_TOUCH_USER, (user_id,))
+
+
+# Permission lookups run on every event but only change through the
+# PermissionsStorage mutators, which clear the cache
+PERMISSION_CACHE_SIZE = 4096
+
+# Shared permission state is re-read from the database at most this often, so
+# changes made by other processes (e.g. an admin script) show up without a restart
+PERMISSION_RELOAD_INTERVAL = 5.0
+
+
+class _PermissionState:
+    """Permission sets and lookup cache for one database, shared by every instance."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        # Bumped on every reload; results computed under an older version are
+        # never stored
+        self.version = 0
+        self.entries: dict[tuple, Any] = {}
+
+        # Admins and open functions are tiny, so they are held in memory and
+        # never queried per event
+        self.admins: frozenset[str] = frozenset()
+        self.open_functions: frozenset[str] = frozenset()
+        self.expires_at = 0.0
+
+
+_permission_states: dict[Path, _PermissionState] = {}
+_permission_states_lock = threading.Lock()
+
+
+def _get_permission_state(db_path: Path) -> _PermissionState:
+    """Get the shared permission state for a database, creating it on first use."""
+    state = _permission_states.get(db_path)
+    if state is None:
+        with _permission_states_lock:
+            state = _permission_states.setdefault(db_path, _PermissionState())
+    return state
 
 
 class PermissionsStorage:
@@ -166,61 +478,110 @@ class PermissionsStorage:
     def __init__(self):
         init_database()
 
+    def _state(self) -> _PermissionState:
+        """Get the shared permission state, reloading it once it has expired."""
+        state = _get_permission_state(get_db_path())
+        if time.monotonic() >= state.expires_at:
+            with state.lock:
+                if time.monotonic() >= state.expires_at:
+                    self._reload(state)
+        return state
+
+    def _reload(self, state: Optional[_PermissionState] = None) -> None:
+        """Re-read the admin and open-function sets and drop cached lookups."""
+        if state is None:
+            state = _get_permission_state(get_db_path())
+        # Held across the queries so other threads never see a half-loaded state
+        with state.lock:
+            with get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT user_id FROM admins")
+                state.admins = frozenset(row["user_id"] for row in cursor.fetchall())
+                cursor.execute("SELECT function_name FROM open_functions")
+                state.open_functions = frozenset(
+                    row["function_name"] for row in cursor.fetchall()
+                )
+            state.version += 1
+            state.entries.clear()
+            state.expires_at = time.monotonic() + PERMISSION_RELOAD_INTERVAL
+
+    def _cached(
+        self,
+        state: _PermissionState,
+        key: tuple,
+        compute: Callable[[], Any]
+    ) -> Any:
+        """Return a cached lookup result, computing and storing it on a miss."""
+        with state.lock:
+            if key in state.entries:
+                return state.entries[key]
+            version = state.version
+
+        value = compute()
+
+        with state.lock:
+            # Don't store a result that raced with a permission change
+            if state.version == version:
+                if len(state.entries) >= PERMISSION_CACHE_SIZE:
+                    state.entries.clear()
+                state.entries[key] = value
+        return value
+
     def is_user_allowed(self, user_id: str, function_name: str) -> bool:
         """Check if user is allowed to access a function."""
+        state = self._state()
+        if user_id in state.admins or function_name in state.open_functions:
+            return True
+        return self._cached(
+            state,
+            ("allowed", user_id, function_name),
+            lambda: self._query_has_permission(user_id, function_name)
+        )
+
+    def _query_has_permission(self, user_id: str, function_name: str) -> bool:
+        """Uncached check for an explicit function grant."""
         with get_connection() as conn:
             cursor = conn.cursor()
-
-            # Check if user is admin
-            cursor.execute("SELECT 1 FROM admins WHERE user_id = ?", (user_id,))
-            if cursor.fetchone():
-                return True
-
-            # Check if function is open to all
-            cursor.execute(
-                "SELECT 1 FROM open_functions WHERE function_name = ?",
-                (function_name,)
-            )
-            if cursor.fetchone():
-                return True
-
-            # Check function-specific permissions
-            cursor.execute("""
-                SELECT 1 FROM function_permissions
-                WHERE function_name = ? AND user_id = ?
-            """, (function_name, user_id))
+            cursor.execute(_SQL_HAS_PERMISSION, (function_name, user_id))
             return cursor.fetchone() is not None
 
     def get_allowed_functions(self, user_id: str, all_functions: list[str]) -> list[str]:
         """Get list of function names the user can access."""
-        with get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Check if user is admin
-            cursor.execute("SELECT 1 FROM admins WHERE user_id = ?", (user_id,))
-            if cursor.fetchone():
-                return all_functions
+        state = self._state()
+        if user_id in state.admins:
+            return list(all_functions)
 
-            allowed = []
-            for func_name in all_functions:
-                # Check if function is open
-                cursor.execute(
-                    "SELECT 1 FROM open_functions WHERE function_name = ?",
-                    (func_name,)
-                )
-                if cursor.fetchone():
-                    allowed.append(func_name)
-                    continue
+        restricted = tuple(
+            name for name in all_functions if name not in state.open_functions
+        )
+        if restricted:
+            granted = self._cached(
+                state,
+                ("granted", user_id, restricted),
+                lambda: self._query_granted_functions(user_id, restricted)
+            )
+        else:
+            granted = frozenset()
 
-                # Check specific permission
-                cursor.execute("""
-                    SELECT 1 FROM function_permissions
-                    WHERE function_name = ? AND user_id = ?
-                """, (func_name, user_id))
-                if cursor.fetchone():
-                    allowed.append(func_name)
+        return [
+            name for name in all_functions
+            if name in state.open_functions or name in granted
+        ]
 
-            return allowed
+    def _query_granted_functions(
+        self,
+        user_id: str,
+        function_names: tuple[str, ...]
+    ) -> frozenset[str]:
+        """Uncached lookup of which of the given functions the user was granted."""
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            placeholders = ", ".join("?" * len(function_names))
+            cursor.execute(f"""
+                SELECT function_name FROM function_permissions
+                WHERE user_id = ? AND function_name IN ({placeholders})
+            """, (user_id, *function_names))
+            return frozenset(row["function_name"] for row in cursor.fetchall())
 
     def add_user_to_function(self, user_id: str, function_name: str) -> None:
         """Add user to a function's allow list."""
@@ -230,6 +591,7 @@ class PermissionsStorage:
                 INSERT OR IGNORE INTO function_permissions (function_name, user_id)
                 VALUES (?, ?)
             """, (function_name, user_id))
+        self._reload()
 
     def remove_user_from_function(self, user_id: str, function_name: str) -> None:
         """Remove user from a function's allow list."""
@@ -239,6 +601,7 @@ class PermissionsStorage:
                 DELETE FROM function_permissions
                 WHERE function_name = ? AND user_id = ?
             """, (function_name, user_id))
+        self._reload()
 
     def set_function_open(self, function_name: str, is_open: bool) -> None:
         """Set whether a function is open to all users."""
@@ -253,6 +616,7 @@ class PermissionsStorage:
                     "DELETE FROM open_functions WHERE function_name = ?",
                     (function_name,)
                 )
+        self._reload()
 
     def add_admin(self, user_id: str) -> None:
         """Add a user as admin."""
@@ -262,19 +626,18 @@ class PermissionsStorage:
                 "INSERT OR IGNORE INTO admins (user_id) VALUES (?)",
                 (user_id,)
             )
+        self._reload()
 
     def remove_admin(self, user_id: str) -> None:
         """Remove a user from admins."""
         with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM admins WHERE user_id = ?", (user_id,))
+        self._reload()
 
     def is_admin(self, user_id: str) -> bool:
         """Check if user is an admin."""
-        with get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1 FROM admins WHERE user_id = ?", (user_id,))
-            return cursor.fetchone() is not None
+        return user_id in self._state().admins
 
     def sync_from_config(self, access_config: dict) -> None:
         """
@@ -289,35 +652,39 @@ class PermissionsStorage:
                 }
             }
         """
+        admin_rows = [(user_id,) for user_id in access_config.get("admins", [])]
+        open_rows = [(func_name,) for func_name in access_config.get("open_functions", [])]
+        permission_rows = [
+            (func_name, user_id)
+            for func_name, user_ids in access_config.get("function_permissions", {}).items()
+            for user_id in user_ids
+        ]
+
+        # Replace everything in one write transaction
         with get_connection() as conn:
             cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
 
             # Clear existing permissions
             cursor.execute("DELETE FROM admins")
             cursor.execute("DELETE FROM open_functions")
             cursor.execute("DELETE FROM function_permissions")
 
-            # Load admins
-            for user_id in access_config.get("admins", []):
-                cursor.execute(
-                    "INSERT OR IGNORE INTO admins (user_id) VALUES (?)",
-                    (user_id,)
-                )
-
-            # Load open functions
-            for func_name in access_config.get("open_functions", []):
-                cursor.execute(
-                    "INSERT OR IGNORE INTO open_functions (function_name) VALUES (?)",
-                    (func_name,)
-                )
+            # Load admins, open functions and per-function user permissions
+            cursor.executemany(
+                "INSERT OR IGNORE INTO admins (user_id) VALUES (?)",
+                admin_rows
+            )
+            cursor.executemany(
+                "INSERT OR IGNORE INTO open_functions (function_name) VALUES (?)",
+                open_rows
+            )
+            cursor.executemany(
+                "INSERT OR IGNORE INTO function_permissions (function_name, user_id) VALUES (?, ?)",
+                permission_rows
+            )
 
-            # Load per-function user permissions
-            for func_name, user_ids in access_config.get("function_permissions", {}).items():
-                for user_id in user_ids:
-                    cursor.execute(
-                        "INSERT OR IGNORE INTO function_permissions (function_name, user_id) VALUES (?, ?)",
-                        (func_name, user_id)
-                    )
+        self._reload()
 
         logger.info(
             f"Synced access config: {len(access_config.get('admins', []))} admins, "
@@ -374,76 +741,65 @@ class UsageLogger:
         if message_preview and len(message_preview) > 100:
             message_preview = message_preview[:100]
 
-        metadata_json = json.dumps(metadata) if metadata else None
+        # Copy so later changes by the caller don't race the writer thread
+        if metadata:
+            metadata = dict(metadata)
 
-        with get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO usage_logs
-                (user_id, function_name, action, message_preview, metadata)
-                VALUES (?, ?, ?, ?, ?)
-            """, (user_id, function_name, action, message_preview, metadata_json))
+        _ensure_log_writer()
+        _log_queue.put(
+            (user_id, function_name, action, message_preview, metadata)
+        )
+
+    def flush(self) -> bool:
+        """Wait (bounded) for queued log entries to be written."""
+        return flush_usage_logs()
 
     def get_user_stats(self, user_id: str) -> dict:
         """Get usage statistics for a user."""
+        self.flush()
         with get_connection() as conn:
             cursor = conn.cursor()
 
-            # Total message count
-            cursor.execute("""
-                SELECT COUNT(*) as count FROM usage_logs
-                WHERE user_id = ? AND action = 'message'
-            """, (user_id,))
-            message_count = cursor.fetchone()["count"]
-
-            # Function breakdown
+            # One grouped pass gives per-function message counts and last activity
             cursor.execute("""
-                SELECT function_name, COUNT(*) as count FROM usage_logs
-                WHERE user_id = ? AND action = 'message'
-                GROUP BY function_name
+                SELECT function_name, action, COUNT(*) as count, MAX(timestamp) as last
+                FROM usage_logs
+                WHERE user_id = ?
+                GROUP BY function_name, action
             """, (user_id,))
-            by_function = {row["function_name"]: row["count"] for row in cursor.fetchall()}
+            rows = cursor.fetchall()
 
-            # Last active
-            cursor.execute("""
-                SELECT MAX(timestamp) as last FROM usage_logs WHERE user_id = ?
-            """, (user_id,))
-            last_active = cursor.fetchone()["last"]
+            by_function = {
+                row["function_name"]: row["count"]
+                for row in rows
+                if row["action"] == "message"
+            }
 
             return {
-                "message_count": message_count,
+                "message_count": sum(by_function.values()),
                 "by_function": by_function,
-                "last_active": last_active
+                "last_active": max((row["last"] for row in rows), default=None)
             }
 
     def get_function_stats(self, function_name: str) -> dict:
         """Get usage statistics for a function."""
+        self.flush()
         with get_connection() as conn:
             cursor = conn.cursor()
 
-            # Total usage
+            # Message count, unique users and error count in a single scan
             cursor.execute("""
-                SELECT COUNT(*) as count FROM usage_logs
-                WHERE function_name = ? AND action = 'message'
-            """, (function_name,))
-            message_count = cursor.fetchone()["count"]
-
-            # Unique users
-            cursor.execute("""
-                SELECT COUNT(DISTINCT user_id) as count FROM usage_logs
+                SELECT
+                    COALESCE(SUM(action = 'message'), 0) as message_count,
+                    COUNT(DISTINCT user_id) as unique_users,
+                    COALESCE(SUM(action = 'error'), 0) as error_count
+                FROM usage_logs
                 WHERE function_name = ?
             """, (function_name,))
-            unique_users = cursor.fetchone()["count"]
-
-            # Error count
-            cursor.execute("""
-                SELECT COUNT(*) as count FROM usage_logs
-                WHERE function_name = ? AND action = 'error'
-            """, (function_name,))
-            error_count = cursor.fetchone()["count"]
+            row = cursor.fetchone()
 
             return {
-                "message_count": message_count,
-                "unique_users": unique_users,
-                "error_count": error_count
+                "message_count": row["message_count"],
+                "unique_users": row["unique_users"],
+                "error_count": row["error_count"]
             }
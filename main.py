@@ -8,9 +8,11 @@ Central bot that:
 """
 
 import os
+import re
 import sys
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -22,6 +24,7 @@ BOT_DIR = Path(__file__).parent
 sys.path.insert(0, str(BOT_DIR))
 
 from core.dispatcher import Dispatcher
+from core.models import DMEvent
 
 # Configure logging
 logging.basicConfig(
@@ -47,7 +50,19 @@ def load_environment():
 
 # Initialize
 load_environment()
-app = App(token=os.environ["SLACK_BOT_TOKEN"])
+
+# Listeners run on a named, bounded pool. Their time goes mostly to plugin
+# HTTP calls, so this caps how many requests are in flight at once
+LISTENER_WORKERS = 8
+
+listener_executor = ThreadPoolExecutor(
+    max_workers=LISTENER_WORKERS,
+    thread_name_prefix="slack-listener"
+)
+app = App(
+    token=os.environ["SLACK_BOT_TOKEN"],
+    listener_executor=listener_executor
+)
 
 # Load access config from access.json if present
 _access_config = {}
@@ -65,32 +80,70 @@ if _access_config:
     dispatcher.permissions.sync_from_config(_access_config)
 
 
+# ============================================================================
+# CACHED DISPLAY TEMPLATES
+# ============================================================================
+
+# App Home blocks shared by every user; only the current function and the
+# function list vary per request
+HOME_HEADER_BLOCKS = (
+    {
+        "type": "header",
+        "text": {"type": "plain_text", "text": "Multi-Function Bot"}
+    },
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": "Welcome! Use slash commands to switch between functions."
+        }
+    },
+    {"type": "divider"},
+)
+HOME_FUNCTIONS_HEADING = {
+    "type": "section",
+    "text": {"type": "mrkdwn", "text": "*Available Functions:*"}
+}
+
+
 # ============================================================================
 # SLASH COMMANDS
 # ============================================================================
 
-def create_slash_command_handler(function_name: str):
-    """Factory to create slash command handler for a function."""
+# Slash command -> function name, filled by register_slash_commands
+_command_functions: dict[str, str] = {}
 
-    def handler(ack, command, say):
-        ack()
-        user_id = command["user_id"]
-        logger.info(f"User {user_id} requested function '{function_name}'")
-        dispatcher.switch_user_function(user_id, function_name, say)
 
-    return handler
+def handle_function_command(ack, command, say):
+    """Switch the user to the function bound to the invoked slash command."""
+    ack()
+    user_id = command["user_id"]
+    function_name = _command_functions.get(command["command"])
+    if function_name is None:
+        logger.warning(f"No function registered for {command['command']}")
+        return
+
+    logger.info(f"User {user_id} requested function '{function_name}'")
+    dispatcher.switch_user_function(user_id, function_name, say)
 
 
 def register_slash_commands():
-    """Register slash commands for all loaded functions."""
-    for func_name, func in dispatcher.functions.items():
-        info = func.get_info()
-        command = info.slash_command
+    """Register one slash command listener covering all loaded functions."""
+    _command_functions.clear()
+    for func_name in dispatcher.get_all_function_names():
+        command = dispatcher.get_function_info(func_name).slash_command
+        _command_functions[command] = func_name
+        logger.info(f"Registered slash command: {command} -> {func_name}")
 
-        handler = create_slash_command_handler(func_name)
-        app.command(command)(handler)
+    if not _command_functions:
+        return
 
-        logger.info(f"Registered slash command: {command} -> {func_name}")
+    # A single listener matching exactly the function commands; the handler
+    # resolves the function with a dict lookup
+    pattern = re.compile(
+        "^(?:" + "|".join(re.escape(c) for c in _command_functions) + ")$"
+    )
+    app.command(pattern)(handle_function_command)
 
 
 @app.command("/bot-help")
@@ -99,27 +152,21 @@ def handle_help_command(ack, command, say):
     ack()
 
     user_id = command["user_id"]
-    functions = dispatcher.get_available_functions_for_user(user_id)
+    allowed = dispatcher.get_allowed_function_names(user_id)
 
-    if not functions:
+    if not allowed:
         say("You don't have access to any functions. Contact an administrator.")
         return
 
     lines = ["*Available Functions:*\n"]
-    for func in functions:
-        info = func.get_info()
-        lines.append(f"*{info.display_name}*")
-        lines.append(f"  Command: `{info.slash_command}`")
-        lines.append(f"  {info.description}\n")
+    lines.extend(dispatcher.get_help_entry(name) for name in allowed)
 
     # Show current function
     current = dispatcher.state_storage.get_current_function(user_id)
     if current:
-        current_func = dispatcher.get_function(current)
-        if current_func:
-            lines.append(
-                f"_Current function: {current_func.get_info().display_name}_"
-            )
+        current_info = dispatcher.get_function_info(current)
+        if current_info:
+            lines.append(f"_Current function: {current_info.display_name}_")
     else:
         lines.append("_No function selected. Use a command above to get started._")
 
@@ -135,9 +182,8 @@ def handle_status_command(ack, command, say):
     current = dispatcher.state_storage.get_current_function(user_id)
 
     if current:
-        func = dispatcher.get_function(current)
-        if func:
-            info = func.get_info()
+        info = dispatcher.get_function_info(current)
+        if info:
             say(
                 f"You're currently using *{info.display_name}*.\n\n"
                 "Type `help` for function-specific help."
@@ -167,15 +213,11 @@ def handle_message(event, say, client):
     if channel_type != "im":
         return
 
-    text = event.get("text", "")
-    if not text:
+    dm = DMEvent.from_slack(event)
+    if dm is None:
         return
 
-    user_id = event.get("user")
-    if not user_id:
-        return
-
-    dispatcher.handle_dm(user_id, text, event, say)
+    dispatcher.handle_dm(dm.user, dm.text, event, say)
 
 
 @app.event("app_mention")
@@ -189,53 +231,26 @@ def handle_app_home(event, client):
     """Update App Home tab when opened."""
     user_id = event["user"]
 
-    functions = dispatcher.get_available_functions_for_user(user_id)
     current = dispatcher.state_storage.get_current_function(user_id)
 
-    blocks = [
-        {
-            "type": "header",
-            "text": {"type": "plain_text", "text": "Multi-Function Bot"}
-        },
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": "Welcome! Use slash commands to switch between functions."
-            }
-        },
-        {"type": "divider"},
-    ]
+    blocks = list(HOME_HEADER_BLOCKS)
 
     if current:
-        func = dispatcher.get_function(current)
-        if func:
+        info = dispatcher.get_function_info(current)
+        if info:
             blocks.append({
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": f"*Current Function:* {func.get_info().display_name}"
+                    "text": f"*Current Function:* {info.display_name}"
                 }
             })
 
-    blocks.append({
-        "type": "section",
-        "text": {"type": "mrkdwn", "text": "*Available Functions:*"}
-    })
-
-    for func in functions:
-        info = func.get_info()
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": (
-                    f"*{info.display_name}*\n"
-                    f"{info.description}\n"
-                    f"Command: `{info.slash_command}`"
-                )
-            }
-        })
+    blocks.append(HOME_FUNCTIONS_HEADING)
+    blocks.extend(
+        dispatcher.get_home_block(name)
+        for name in dispatcher.get_allowed_function_names(user_id)
+    )
 
     try:
         client.views_publish(